@@ -1,17 +1,27 @@
+from functools import partial
+
 from .anime import AnimeHandler
-from .movie import handle_movie
-from .book import handle_book
-from .standard import handle_std
+from .movie import MovieHandler
+from .book import BookHandler
+from .standard import StdHandler
+
+__all__ = [
+    "AnimeHandler",
+    "MovieHandler",
+    "BookHandler",
+    "StdHandler",
+    "COMMAND_HANDLERS",
+]
 
 
-def run_anime_handler(args):
-    """Instantiates and runs the AnimeHandler."""
-    AnimeHandler(args).handle()
+def _run_handler(handler_class, args):
+    """Instantiates the given handler class and runs it."""
+    handler_class(args).handle()
 
 
 COMMAND_HANDLERS = {
-    "anime": run_anime_handler,
-    "movie": handle_movie,
-    "book": handle_book,
-    "std": handle_std,
+    "anime": partial(_run_handler, AnimeHandler),
+    "movie": partial(_run_handler, MovieHandler),
+    "book": partial(_run_handler, BookHandler),
+    "std": partial(_run_handler, StdHandler),
 }
@@ -1,10 +1,12 @@
 import argparse
+import bisect
 import os
 import json
 import csv
 import re
 import sys
-from typing import Any, List, Dict, Optional, Tuple
+import time
+from typing import Any, Dict, Final, List, Optional, Tuple
 
 from .base_handler import BaseHandler
 
@@ -15,19 +17,37 @@ except ImportError:
     sanitize_filename = None  # type: ignore
 
 
-SUBTITLE_EXTENSIONS: Tuple[str, ...] = (
+SUBTITLE_EXTENSIONS: Final[Tuple[str, ...]] = (
     ".srt",
     ".vtt",
     ".ass",
     ".sub",
 )
-VIDEO_EXTENSIONS: Tuple[str, ...] = (
+VIDEO_EXTENSIONS: Final[Tuple[str, ...]] = (
     ".mp4",
     ".mkv",
     ".ts",
     ".avi",
 )  # Default video extensions
 
+# How long a previously fetched Jikan CSV stays valid before --online
+# refetches it. Episode lists rarely change, so re-runs within this window
+# skip the network round-trips entirely.
+JIKAN_CSV_MAX_AGE_SECONDS: Final[int] = 6 * 86400
+
+# Deletes every invalid filename character in one C-level pass; built once
+# since episode titles are sanitized in the per-file loop.
+_INVALID_FILENAME_CHARS_TABLE = str.maketrans("", "", '<>:"/\\|?*')
+
+# Rewrites named capture groups to plain groups so multiple patterns can be
+# OR-ed into one prescreen regex without group-name collisions.
+_NAMED_GROUP_RE = re.compile(r"\(\?P<[^>]+>")
+
+# Matches filenames already in the standardized output format
+# ("Series - S01 - E01 - Title.ext"); those can be skipped before any
+# extraction or name construction work is done.
+_ALREADY_STANDARDIZED_RE = re.compile(r" - (?:S\d{2} - )?E\d{2}(?: - .+)?\.[^.]+$")
+
 EPISODE_PATTERNS_CONFIG = [
     # Example: "Watch Raise wa Tanin ga Ii 1st Season Episode 01 English Subbed at Site Name"
     {
@@ -64,6 +84,160 @@ EPISODE_PATTERNS_CONFIG = [
 ]
 
 
+# A compiled pattern flattened to
+# (compiled, literal_gate, series_group, season_group, episode_group,
+# season_default).
+_FlatPattern = Tuple[
+    "re.Pattern[str]",
+    Optional[str],
+    Optional[str],
+    Optional[str],
+    Optional[str],
+    Optional[int],
+]
+
+# Leading run of plain literal characters in a pattern source (after an
+# optional ^ anchor); used to derive the cheap substring gate below.
+_LITERAL_PREFIX_RE = re.compile(r"\^?([A-Za-z0-9 _'-]{3,})")
+
+
+def _has_top_level_alternation(source: str) -> bool:
+    """
+    Reports whether a pattern source contains a ``|`` at nesting depth 0.
+
+    Such a pattern can match via a branch that does not start with the
+    leading literal, so no prefix-derived gate is sound for it. Bars inside
+    groups (e.g. ``(?:st|nd|rd|th)``) or character classes do not count.
+    """
+    depth = 0
+    in_class = False
+    index = 0
+    length = len(source)
+    while index < length:
+        char = source[index]
+        if char == "\\":
+            index += 2
+            continue
+        if in_class:
+            if char == "]":
+                in_class = False
+        elif char == "[":
+            in_class = True
+        elif char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif char == "|" and depth == 0:
+            return True
+        index += 1
+    return False
+
+
+def _literal_gate(source: str) -> Optional[str]:
+    """
+    Derives a required literal substring from the start of a pattern source.
+
+    A pattern beginning with plain characters (e.g. ``Watch\\s+...``) can only
+    match filenames containing that literal, so a lowercase ``in`` check - a
+    C-level memchr scan - rejects non-candidates without ever starting the
+    regex engine. Patterns opening with a metacharacter get no gate, and
+    neither do patterns with a top-level alternation, whose other branches
+    need not contain the leading literal at all.
+
+    Returns:
+        The lowercased literal, or None when no usable literal exists.
+    """
+    if _has_top_level_alternation(source):
+        return None
+    match = _LITERAL_PREFIX_RE.match(source)
+    if match is None:
+        return None
+    literal = match.group(1)
+    # A trailing quantifier binds to the literal's last character, making it
+    # optional or repeatable; drop that character so the gate stays required.
+    if source[match.end() : match.end() + 1] in ("*", "+", "?", "{"):
+        literal = literal[:-1]
+    return literal.lower() if len(literal) >= 3 else None
+
+
+def _compile_pattern_configs(
+    configs: List[Dict[str, Any]],
+) -> Tuple[List[_FlatPattern], List[str]]:
+    """
+    Compiles episode pattern configs into flat tuples.
+
+    Invalid entries are skipped with a warning rather than failing the run.
+
+    Args:
+        configs: Pattern configuration dictionaries (defaults or custom).
+
+    Returns:
+        A (compiled_patterns, valid_sources) tuple, where valid_sources holds
+        the raw pattern strings that compiled successfully (used to build the
+        prescreen alternation).
+    """
+    compiled_patterns: List[_FlatPattern] = []
+    valid_sources: List[str] = []
+    for config_item in configs:
+        try:
+            compiled = re.compile(config_item["pattern"], re.IGNORECASE)
+            groups = config_item.get("groups", {})
+        except (re.error, KeyError, TypeError) as e:
+            print(
+                f"Warning: Skipping invalid episode pattern {config_item!r}: {e}",
+                file=sys.stderr,
+            )
+            continue
+        valid_sources.append(config_item["pattern"])
+        compiled_patterns.append(
+            (
+                compiled,
+                _literal_gate(config_item["pattern"]),
+                groups.get("series_name"),
+                groups.get("season_num"),
+                groups.get("episode_num"),
+                config_item.get("season_default"),
+            )
+        )
+    return compiled_patterns, valid_sources
+
+
+def _build_prescreen(
+    valid_sources: List[str],
+) -> Tuple[Optional["re.Pattern[str]"], Optional["re.Pattern[str]"]]:
+    """
+    Builds the single-file and batch (MULTILINE) prescreen alternations.
+
+    Returns:
+        A (prescreen_re, prescreen_batch_re) tuple; both are None when no
+        usable prescreen can be built from the given pattern sources.
+    """
+    if not valid_sources:
+        return None, None
+    prescreen_source = "|".join(
+        f"(?:{_NAMED_GROUP_RE.sub('(?:', source)})" for source in valid_sources
+    )
+    try:
+        return (
+            re.compile(prescreen_source, re.IGNORECASE),
+            re.compile(prescreen_source, re.IGNORECASE | re.MULTILINE),
+        )
+    except re.error:
+        # Exotic custom patterns (e.g. with backreferences) may not survive
+        # anonymization; the per-pattern loop still works without prescreen.
+        return None, None
+
+
+# Compiled once at import: every AnimeHandler without a custom pattern config
+# shares these instead of recompiling per instance.
+_DEFAULT_COMPILED_PATTERNS, _DEFAULT_PATTERN_SOURCES = _compile_pattern_configs(
+    EPISODE_PATTERNS_CONFIG
+)
+_DEFAULT_PRESCREEN_RE, _DEFAULT_PRESCREEN_BATCH_RE = _build_prescreen(
+    _DEFAULT_PATTERN_SOURCES
+)
+
+
 class AnimeHandler(BaseHandler):
     """
     Handles the renaming of anime files.
@@ -77,16 +251,42 @@ class AnimeHandler(BaseHandler):
         self.episode_patterns_config: List[Dict[str, Any]] = list(
             EPISODE_PATTERNS_CONFIG
         )  # Use a copy
+        self._uses_custom_patterns: bool = False
 
-        # Load external config if provided by the user
-        if hasattr(args, "config") and args.config:
-            self._load_external_config(args.config)
+        # Load external config if provided by the user. getattr with a
+        # default does one lookup; hasattr would pay a second lookup plus
+        # exception handling for namespaces without the attribute.
+        config_path = getattr(args, "config", None)
+        if config_path:
+            self._load_external_config(config_path)
 
         # Combine extensions to determine relevant media files
         self.relevant_media_extensions: Tuple[str, ...] = (
             self.video_extensions + self.subtitle_extensions
         )
 
+        # Matching state: the default pattern set is compiled once at module
+        # import and shared; only custom configs pay a per-instance compile.
+        # Flattened tuples mean the per-file loop never chases dict lookups,
+        # and the prescreen alternation rejects non-candidates in one pass.
+        if self._uses_custom_patterns:
+            self._compiled_patterns, valid_sources = _compile_pattern_configs(
+                self.episode_patterns_config
+            )
+            self._prescreen_re, self._prescreen_batch_re = _build_prescreen(
+                valid_sources
+            )
+        else:
+            self._compiled_patterns = _DEFAULT_COMPILED_PATTERNS
+            self._prescreen_re = _DEFAULT_PRESCREEN_RE
+            self._prescreen_batch_re = _DEFAULT_PRESCREEN_BATCH_RE
+
+        # Memoized per-filename extraction results: the same filename is
+        # parsed from several call sites (title inference, rename pass).
+        self._extract_cache: Dict[
+            str, Tuple[Optional[str], Optional[int], Optional[int], str]
+        ] = {}
+
     # ----------------------- Configuration Loading Methods ---------------------- #
     def _set_video_extensions(self, extensions_value: Any, config_path: str) -> None:
         """
@@ -99,7 +299,10 @@ class AnimeHandler(BaseHandler):
         if isinstance(extensions_value, list) and all(
             isinstance(ext, str) for ext in extensions_value
         ):
-            self.video_extensions = tuple(extensions_value)
+            # Normalized to lowercase once here; the listing predicate
+            # compares against lowercased names and must not re-normalize
+            # (or silently miss mixed-case config entries) per file.
+            self.video_extensions = tuple(ext.lower() for ext in extensions_value)
             print(f"  Loaded custom video extensions: {self.video_extensions}")
         else:
             print(
@@ -118,7 +321,7 @@ class AnimeHandler(BaseHandler):
         if isinstance(extensions_value, list) and all(
             isinstance(ext, str) for ext in extensions_value
         ):
-            self.subtitle_extensions = tuple(extensions_value)
+            self.subtitle_extensions = tuple(ext.lower() for ext in extensions_value)
             print(f"  Loaded custom subtitle extensions: {self.subtitle_extensions}")
         else:
             print(
@@ -136,6 +339,7 @@ class AnimeHandler(BaseHandler):
         """
         if isinstance(patterns_value, list):
             self.episode_patterns_config = patterns_value
+            self._uses_custom_patterns = True
             print(
                 f"  Loaded {len(self.episode_patterns_config)} custom episode patterns."
             )
@@ -187,46 +391,98 @@ class AnimeHandler(BaseHandler):
 
     # ------------- Anime Information Extraction and Renaming Methods ------------ #
     def _process_match(
-        self, config: Dict[str, Any], match: re.Match, file_ext: str
+        self,
+        match: re.Match,
+        series_group: Optional[str],
+        season_group: Optional[str],
+        episode_group: Optional[str],
+        season_default: Optional[int],
+        file_ext: str,
     ) -> Tuple[Optional[str], Optional[int], Optional[int], str]:
         """
-        Processes a regex match object based on its associated configuration.
+        Processes a regex match object using pre-extracted group names.
+
+        The group names and season default come from the flattened pattern
+        tuples built in `__init__`, so no per-match dict traversal is needed.
 
         Args:
-            config: The specific pattern configuration dictionary from
-                    `EPISODE_PATTERNS_CONFIG` (or custom loaded patterns)
-                    that yielded the match.
             match: The `re.Match` object resulting from a successful pattern search.
+            series_group: Name of the capture group holding the series name, if any.
+            season_group: Name of the capture group holding the season number, if any.
+            episode_group: Name of the capture group holding the episode number, if any.
+            season_default: Fallback season number when no season group exists.
             file_ext: The file extension of the processed file (e.g., ".mkv").
 
         Returns:
             A tuple containing: (series_name, season_num, episode_num, file_ext).
             Each of series_name, season_num, episode_num can be None if not found.
         """
-        series_name = (
-            match.group(config["groups"].get("series_name")).strip()
-            if "series_name" in config["groups"]
-            else None
-        )
-
-        season_num = None
-        if "season_num" in config["groups"]:
+        # The group may not have participated in the match (e.g. the winning
+        # branch of an alternation does not contain it), in which case
+        # match.group returns None rather than a string.
+        series_value = match.group(series_group) if series_group else None
+        # Interning collapses the many per-file copies of the same series
+        # title into one shared string, so later dict lookups keyed on it
+        # (episode data, extraction cache hits) compare by pointer.
+        series_name = sys.intern(series_value.strip()) if series_value else None
+
+        # TypeError covers groups that did not participate in the match,
+        # where match.group returns None instead of a digit string.
+        if season_group:
             try:
-                season_num = int(match.group(config["groups"]["season_num"]))
-            except (ValueError, IndexError):
+                season_num = int(match.group(season_group))
+            except (TypeError, ValueError, IndexError):
                 season_num = None
-        elif "season_default" in config:
-            season_num = config.get("season_default")
+        else:
+            season_num = season_default
 
         episode_num = None
-        if "episode_num" in config["groups"]:
+        if episode_group:
             try:
-                episode_num = int(match.group(config["groups"]["episode_num"]))
-            except (ValueError, IndexError):
+                episode_num = int(match.group(episode_group))
+            except (TypeError, ValueError, IndexError):
                 episode_num = None
 
         return (series_name, season_num, episode_num, file_ext)
 
+    def _prescreen_files(self, files: List[str]) -> Optional[List[bool]]:
+        """
+        Prescreens a whole batch of filenames in a single regex pass.
+
+        The filenames are joined with newlines and scanned once with the
+        MULTILINE-compiled prescreen alternation, amortizing the regex
+        engine's per-invocation setup across the batch. Every file touched
+        by a match span is marked as a candidate (over-marking is safe: the
+        per-pattern capture loop still decides the final outcome).
+
+        Args:
+            files: List of filenames (basenames) to prescreen.
+
+        Returns:
+            A per-file list of booleans (True = worth full extraction), or
+            None when batch prescreening is unavailable and the caller should
+            fall back to per-file checks.
+        """
+        if self._prescreen_batch_re is None or not files:
+            return None
+        if any("\n" in name for name in files):
+            # Newlines in filenames would corrupt the offset mapping.
+            return None
+
+        joined = "\n".join(files)
+        # starts[i] is the offset of files[i] inside the joined text.
+        starts = [0]
+        for name in files[:-1]:
+            starts.append(starts[-1] + len(name) + 1)
+
+        matched = [False] * len(files)
+        for match in self._prescreen_batch_re.finditer(joined):
+            first = bisect.bisect_right(starts, match.start()) - 1
+            last = bisect.bisect_right(starts, max(match.end() - 1, 0)) - 1
+            for index in range(first, last + 1):
+                matched[index] = True
+        return matched
+
     def _extract_anime_info(
         self, filename: str
     ) -> Tuple[Optional[str], Optional[int], Optional[int], str]:
@@ -241,13 +497,44 @@ class AnimeHandler(BaseHandler):
             Series name, season number, or episode number will be None if not found.
             Returns (None, None, None, file_ext) if no configured pattern matches.
         """
+        cached = self._extract_cache.get(filename)
+        if cached is not None:
+            return cached
+
         _, file_ext = os.path.splitext(filename)
-        for config_item in self.episode_patterns_config:
-            compiled_pattern = re.compile(config_item["pattern"], re.IGNORECASE)
+        filename_lower = filename.lower()
+        result: Tuple[Optional[str], Optional[int], Optional[int], str] = (
+            None,
+            None,
+            None,
+            file_ext,
+        )
+        for (
+            compiled_pattern,
+            literal_gate,
+            series_group,
+            season_group,
+            episode_group,
+            season_default,
+        ) in self._compiled_patterns:
+            # Substring gate first: a pattern whose required literal (e.g.
+            # "watch") is absent cannot match, so skip the regex VM entirely.
+            if literal_gate is not None and literal_gate not in filename_lower:
+                continue
             match = compiled_pattern.search(filename)
             if match:
-                return self._process_match(config_item, match, file_ext=file_ext)
-        return (None, None, None, file_ext)
+                result = self._process_match(
+                    match,
+                    series_group,
+                    season_group,
+                    episode_group,
+                    season_default,
+                    file_ext=file_ext,
+                )
+                break
+
+        self._extract_cache[filename] = result
+        return result
 
     def _construct_new_anime_filename(
         self,
@@ -282,69 +569,72 @@ class AnimeHandler(BaseHandler):
         name_parts.append(episode_num_str)
         if episode_title:
             # Sanitize episode title by removing characters invalid in filenames
-            sanitized_title = re.sub(r'[<>:"/\\|?*]', "", episode_title.strip())
+            sanitized_title = episode_title.strip().translate(
+                _INVALID_FILENAME_CHARS_TABLE
+            )
             if sanitized_title:
                 name_parts.append(sanitized_title)
 
         return " - ".join(name_parts) + file_ext
 
-    def _rename_anime_file(
+    def _prepare_rename(
         self,
         current_filepath: str,
         original_filename: str,
+        series_name: Optional[str],
+        episode_num: Optional[int],
+        file_ext: str,
         season_override: Optional[int] = None,
         episode_title: Optional[str] = None,
-        series_title_override: Optional[str] = None,
-    ) -> None:
+    ) -> Optional[Tuple[str, str]]:
         """
-        Renames a single anime file based on extracted info and provided details.
+        Builds the rename pair for a single anime file from already-extracted info.
+
+        The caller is expected to have run `_extract_anime_info` (and applied
+        any series title override) exactly once per file; this method only
+        builds the new name, so the regex work is never paid twice per file.
 
         Args:
             current_filepath: Full current path to the file.
             original_filename: Original filename (basename).
+            series_name: Final series name to use (override already applied).
+            episode_num: Extracted episode number.
+            file_ext: File extension of the file (can be "").
             season_override: Effective season number to use in the new filename.
             episode_title: Optional episode title for the new filename.
-            series_title_override: Optional series title to use, overriding any
-                                   extracted series title from the filename.
+
+        Returns:
+            An (old_filepath, new_filepath) tuple ready for renaming, or None
+            if the file has to be skipped.
         """
         try:
-            extracted_series_name, _, episode_num, file_ext = self._extract_anime_info(
-                original_filename
-            )
-
-            # Determine the final series name: override if provided, else extracted.
-            final_series_name = (
-                series_title_override
-                if series_title_override
-                else extracted_series_name
-            )
-
             if (
-                final_series_name and episode_num is not None and file_ext is not None
+                series_name and episode_num is not None and file_ext is not None
             ):  # file_ext can be ""
                 new_name = self._construct_new_anime_filename(
-                    series_name=final_series_name,
+                    series_name=series_name,
                     episode_num=episode_num,
                     file_ext=file_ext,
                     season=season_override,
                     episode_title=episode_title,
                 )
-                new_filepath = os.path.join(os.path.dirname(current_filepath), new_name)
-                super()._perform_rename_operation(current_filepath, new_filepath)
-            else:
-                missing_parts = []
-                if not final_series_name:
-                    missing_parts.append("series name")
-                if episode_num is None:
-                    missing_parts.append("episode number")
-                print(
-                    f"Skipping: {original_filename} (could not determine {', '.join(missing_parts)} for renaming)"
-                )
+                # base_dir is already known at the call site; re-deriving it
+                # with os.path.dirname would rescan the path string per file.
+                return (current_filepath, self._base_prefix + new_name)
+            missing_parts = []
+            if not series_name:
+                missing_parts.append("series name")
+            if episode_num is None:
+                missing_parts.append("episode number")
+            print(
+                f"Skipping: {original_filename} (could not determine {', '.join(missing_parts)} for renaming)"
+            )
         except Exception as e:
             print(
                 f"An unexpected error occurred while preparing to rename '{original_filename}': {e}",
                 file=sys.stderr,
             )
+        return None
 
     def _process_anime_files(
         self,
@@ -363,13 +653,49 @@ class AnimeHandler(BaseHandler):
             series_title_override: Optional series title to use for all files.
             episode_data: Optional dictionary mapping episode number to episode title.
         """
-        for original_filename in files_to_process:
-            current_filepath = os.path.join(self.base_dir, original_filename)
+        # Phase 1: extract info and build all rename pairs sequentially.
+        # One finditer pass over the joined listing rejects names no pattern
+        # can match, instead of running every pattern per file.
+        prescreen_results = self._prescreen_files(files_to_process)
+
+        rename_pairs: List[Tuple[str, str]] = []
+        for index, original_filename in enumerate(files_to_process):
+            # Files already in the target format need no extraction, no new
+            # name and no rename syscall - the dominant case on re-runs. Only
+            # safe with the default patterns, none of which can match a
+            # standardized name; custom configs may deliberately target them.
+            if not self._uses_custom_patterns and _ALREADY_STANDARDIZED_RE.search(
+                original_filename
+            ):
+                print(f"Skipped (already standardized): {original_filename}")
+                continue
 
-            _series_name_from_file, season_from_file, episode_num, _ = (
+            if prescreen_results is not None:
+                worth_extracting = prescreen_results[index]
+            else:
+                worth_extracting = (
+                    self._prescreen_re is None
+                    or self._prescreen_re.search(original_filename) is not None
+                )
+            if not worth_extracting:
+                print(
+                    f"Skipping: {original_filename} (no episode pattern matched)"
+                )
+                continue
+
+            current_filepath = self._base_prefix + original_filename
+
+            series_name_from_file, season_from_file, episode_num, file_ext = (
                 self._extract_anime_info(original_filename)
             )
 
+            # Determine the final series name: override if provided, else extracted.
+            final_series_name = (
+                series_title_override
+                if series_title_override
+                else series_name_from_file
+            )
+
             effective_season = (
                 season_from_file
                 if season_from_file is not None
@@ -380,13 +706,26 @@ class AnimeHandler(BaseHandler):
             if episode_num is not None and episode_data:
                 episode_title = episode_data.get(episode_num)
 
-            self._rename_anime_file(
+            pair = self._prepare_rename(
                 current_filepath,
                 original_filename,
+                final_series_name,
+                episode_num,
+                file_ext,
                 season_override=effective_season,
                 episode_title=episode_title,
-                series_title_override=series_title_override,
             )
+            if pair is not None:
+                rename_pairs.append(pair)
+
+        # Phase 2: all files share base_dir, so open it once and dispatch the
+        # independent renames concurrently via dir_fd (renameat).
+        dir_fd = super()._open_base_dir_fd()
+        try:
+            super()._execute_rename_batch(rename_pairs, dir_fd=dir_fd)
+        finally:
+            if dir_fd is not None:
+                os.close(dir_fd)
 
     # -------------------- Jikan API and CSV Handling Methods -------------------- #
     def _load_episode_titles_from_csv(
@@ -407,34 +746,37 @@ class AnimeHandler(BaseHandler):
         episode_titles: Dict[int, str] = {}
         try:
             with open(csv_filepath, "r", newline="", encoding="utf-8") as csvfile:
-                reader = csv.DictReader(csvfile)
+                # csv.reader with positional indices resolved once from the
+                # header; DictReader would build a dict and pay per-column
+                # hash lookups for every row.
+                reader = csv.reader(csvfile)
+                header = next(reader, None)
                 if (
-                    "Episode MAL ID" not in reader.fieldnames
-                    or "Episode Title" not in reader.fieldnames
+                    header is None
+                    or "Episode MAL ID" not in header
+                    or "Episode Title" not in header
                 ):
                     print(
                         f"Error: CSV file '{csv_filepath}' is missing required columns ('Episode MAL ID', 'Episode Title').",
                         file=sys.stderr,
                     )
                     return None
+                mal_id_index = header.index("Episode MAL ID")
+                title_index = header.index("Episode Title")
 
                 for i, row in enumerate(reader):
                     try:
-                        episode_mal_id_str = row.get("Episode MAL ID")
-                        episode_title = row.get("Episode Title")
-
-                        if episode_mal_id_str is None or episode_title is None:
-                            print(
-                                f"Warning: Skipping row {i+2} in '{csv_filepath}' due to missing MAL ID or Title.",
-                                file=sys.stderr,
-                            )
-                            continue
-
-                        episode_num = int(episode_mal_id_str)
-                        episode_titles[episode_num] = episode_title
+                        episode_num = int(row[mal_id_index])
+                        episode_titles[episode_num] = row[title_index]
+                    except IndexError:
+                        print(
+                            f"Warning: Skipping row {i+2} in '{csv_filepath}' due to missing MAL ID or Title.",
+                            file=sys.stderr,
+                        )
+                        continue
                     except ValueError:
                         print(
-                            f"Warning: Invalid episode number '{row.get('Episode MAL ID')}' in '{csv_filepath}' at row {i+2}. Skipping.",
+                            f"Warning: Invalid episode number '{row[mal_id_index]}' in '{csv_filepath}' at row {i+2}. Skipping.",
                             file=sys.stderr,
                         )
                         continue
@@ -458,14 +800,23 @@ class AnimeHandler(BaseHandler):
         Returns:
             The series title string if specified or successfully inferred, otherwise None.
         """
-        if hasattr(self.args, "title") and self.args.title:
-            return self.args.title
+        title = getattr(self.args, "title", None)
+        if title:
+            return title
 
         if self.args.online and self.target_files:
             print(
                 "No --title provided for online search, attempting to infer from filenames..."
             )
             for filename in self.target_files:
+                # One inference hit is enough, so reject obvious non-matches
+                # with the cheap prescreen before paying full extraction for
+                # files that cannot yield a series name anyway.
+                if (
+                    self._prescreen_re is not None
+                    and self._prescreen_re.search(filename) is None
+                ):
+                    continue
                 extracted_name, _, _, _ = self._extract_anime_info(filename)
                 if extracted_name:
                     print(
@@ -491,6 +842,24 @@ class AnimeHandler(BaseHandler):
                 )
             return
 
+        # Re-use a previously fetched CSV while it is still fresh; re-running
+        # the command on the same directory should not pay the network cost.
+        if sanitize_filename is not None:
+            csv_filename = (
+                f"{sanitize_filename(series_title_for_jikan)}_episodes_jikan.csv"
+            )
+            csv_filepath = os.path.join(self.base_dir, csv_filename)
+            try:
+                csv_age = time.time() - os.path.getmtime(csv_filepath)
+            except OSError:
+                csv_age = None
+            if csv_age is not None and csv_age < JIKAN_CSV_MAX_AGE_SECONDS:
+                print(
+                    f"Using cached Jikan data '{csv_filepath}' "
+                    f"(fetched {csv_age / 86400:.1f} days ago); skipping online fetch."
+                )
+                return
+
         print("Online mode enabled: Attempting to fetch data from Jikan API...")
         if JikanFetcher is None:
             print(
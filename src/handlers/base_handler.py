@@ -1,7 +1,26 @@
 import argparse
+import functools
 import os
 import sys
-from typing import List, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import FrozenSet, Iterator, List, Optional, Tuple
+
+# Module-level binding so the hot rename loop skips the `os` attribute
+# lookup on every call.
+_rename = os.rename
+
+# os.rename only accepts dir_fd arguments on platforms exposing renameat.
+_RENAME_SUPPORTS_DIR_FD = os.rename in os.supports_dir_fd
+
+
+@functools.lru_cache(maxsize=16)
+def _extension_set(valid_extensions: Tuple[str, ...]) -> FrozenSet[str]:
+    """Returns the lowercased, dotless lookup set for an extensions tuple.
+
+    Cached per tuple so repeated listings with the same extensions (the
+    normal case) skip rebuilding the set.
+    """
+    return frozenset(ext.lstrip(".").lower() for ext in valid_extensions)
 
 
 class BaseHandler:
@@ -16,6 +35,7 @@ class BaseHandler:
         self.args = args
         self.base_dir: str = ""
         self.target_files: List[str] = []
+        self.max_jobs: Optional[int] = getattr(args, "jobs", None)
 
         if self.args.directory:
             self.base_dir = self.args.directory
@@ -23,6 +43,42 @@ class BaseHandler:
             self.base_dir = os.path.dirname(self.args.file) or os.getcwd()
             self.target_files = [os.path.basename(self.args.file)]
 
+        # Separator-terminated prefix so hot loops can build paths with one
+        # string concatenation instead of an os.path.join call per file.
+        self._base_prefix: str = (
+            os.path.join(self.base_dir, "") if self.base_dir else ""
+        )
+
+    def _iter_files_in_directory(
+        self, directory_path: str, valid_extensions: Tuple[str, ...]
+    ) -> Iterator[str]:
+        """
+        Lazily yields files within a directory that match valid extensions.
+
+        Streaming variant of `_list_files_in_directory`: names are yielded as
+        os.scandir produces them, so memory stays flat for huge directories
+        and callers can start processing (or bail out) before the full
+        listing exists. OS errors propagate to the caller.
+
+        Uses os.scandir so the dirent data cached by the directory read
+        answers is_file() without an extra stat call per entry.
+        """
+        # Lowercase only the short trailing extension rather than allocating
+        # a lowercased copy of every full filename, and test membership in a
+        # frozenset instead of walking the extension tuple per entry.
+        extension_set = _extension_set(valid_extensions)
+        with os.scandir(directory_path) as entries:
+            # Extension test first: it is pure string work and rejects
+            # most entries before the (cheap but not free) is_file call.
+            for entry in entries:
+                _, sep, extension = entry.name.rpartition(".")
+                if (
+                    sep
+                    and extension.lower() in extension_set
+                    and entry.is_file(follow_symlinks=False)
+                ):
+                    yield entry.name
+
     def _list_files_in_directory(
         self, directory_path: str, valid_extensions: Tuple[str, ...]
     ) -> List[str]:
@@ -31,11 +87,9 @@ class BaseHandler:
         Handles potential OS errors during listing.
         """
         try:
-            return [
-                filename
-                for filename in os.listdir(directory_path)
-                if filename.lower().endswith(valid_extensions)
-            ]
+            return list(
+                self._iter_files_in_directory(directory_path, valid_extensions)
+            )
         except FileNotFoundError:
             print(
                 f"Error: Directory '{directory_path}' not found during file listing.",
@@ -60,27 +114,214 @@ class BaseHandler:
             )
             return []
 
-    def _perform_rename_operation(self, old_filepath: str, new_filepath: str) -> None:
+    def _open_base_dir_fd(self) -> Optional[int]:
+        """
+        Opens the base directory once for dir_fd-based (renameat) renames.
+
+        Returns:
+            An open file descriptor for `base_dir`, or None if the platform
+            does not support dir_fd renames or the directory cannot be opened.
+            The caller is responsible for closing the descriptor.
+        """
+        if not _RENAME_SUPPORTS_DIR_FD or not self.base_dir:
+            return None
+        try:
+            return os.open(
+                self.base_dir, os.O_RDONLY | getattr(os, "O_DIRECTORY", 0)
+            )
+        except OSError:
+            return None
+
+    def _rename_one(
+        self, old_filepath: str, new_filepath: str, dir_fd: Optional[int] = None
+    ) -> Tuple[str, bool]:
+        """
+        Performs a single rename and returns its status line.
+
+        Returns:
+            A (message, is_error) tuple; the caller decides where and when
+            to print, which keeps this method safe to run off the main thread.
+        """
         original_basename = os.path.basename(old_filepath)
         new_basename = os.path.basename(new_filepath)
 
         if old_filepath == new_filepath:
-            print(f"Skipped (no change): {original_basename}")
-            return
+            return (f"Skipped (no change): {original_basename}", False)
         try:
-            os.rename(old_filepath, new_filepath)
-            print(f"Renamed: {original_basename} -> {new_basename}")
+            # POSIX rename silently replaces an existing destination; refuse
+            # instead of destroying a file the batch never intended to touch.
+            if self._destination_exists(new_filepath, new_basename, dir_fd):
+                return (
+                    f"Error: Not renaming '{original_basename}': destination "
+                    f"'{new_basename}' already exists.",
+                    True,
+                )
+            if dir_fd is not None:
+                # renameat against an already-open directory fd: the kernel
+                # skips re-resolving every path component of base_dir for
+                # both the source and the destination.
+                _rename(
+                    original_basename,
+                    new_basename,
+                    src_dir_fd=dir_fd,
+                    dst_dir_fd=dir_fd,
+                )
+            else:
+                _rename(old_filepath, new_filepath)
+            return (f"Renamed: {original_basename} -> {new_basename}", False)
         except OSError as e:
-            print(
+            return (
                 f"Error renaming '{original_basename}' to '{new_basename}': {e}",
-                file=sys.stderr,
+                True,
             )
         except Exception as e:
-            print(
+            return (
                 f"An unexpected error occurred while renaming '{original_basename}': {e}",
-                file=sys.stderr,
+                True,
             )
 
+    @staticmethod
+    def _destination_exists(
+        new_filepath: str, new_basename: str, dir_fd: Optional[int]
+    ) -> bool:
+        """Checks whether a rename destination already exists (without following symlinks)."""
+        if dir_fd is not None:
+            try:
+                os.stat(new_basename, dir_fd=dir_fd, follow_symlinks=False)
+                return True
+            except OSError:
+                return False
+        return os.path.lexists(new_filepath)
+
+    def _perform_rename_operation(
+        self, old_filepath: str, new_filepath: str, dir_fd: Optional[int] = None
+    ) -> None:
+        message, is_error = self._rename_one(old_filepath, new_filepath, dir_fd=dir_fd)
+        print(message, file=sys.stderr if is_error else sys.stdout)
+
+    def _execute_rename_batch(
+        self,
+        rename_pairs: List[Tuple[str, str]],
+        dir_fd: Optional[int] = None,
+    ) -> None:
+        """
+        Executes a batch of independent rename operations.
+
+        Renames are metadata-bound syscalls with no data dependency between
+        files, so batches are dispatched through a thread pool; results are
+        printed from the calling thread, in order, to keep output readable.
+
+        Args:
+            rename_pairs: List of (old_filepath, new_filepath) tuples.
+            dir_fd: Optional open fd for the shared containing directory.
+        """
+        if not rename_pairs:
+            return
+
+        # Guard against two sources racing toward the same destination; the
+        # first claim wins and the rest are reported instead of dispatched.
+        seen_destinations = set()
+        deduped_pairs: List[Tuple[str, str]] = []
+        for old, new in rename_pairs:
+            if new in seen_destinations:
+                print(
+                    f"Error: Skipping '{os.path.basename(old)}': destination "
+                    f"'{os.path.basename(new)}' is already targeted by another rename.",
+                    file=sys.stderr,
+                )
+                continue
+            seen_destinations.add(new)
+            deduped_pairs.append((old, new))
+        rename_pairs = deduped_pairs
+        if not rename_pairs:
+            return
+
+        try:
+            first_phase, second_phase = self._resolve_rename_conflicts(rename_pairs)
+            self._run_rename_phase(first_phase, dir_fd)
+            # The second phase only exists when destinations collided with
+            # pending sources; it must wait until every source moved aside.
+            self._run_rename_phase(second_phase, dir_fd)
+        finally:
+            # Durability for the whole batch is a single directory fsync at
+            # the end - never one per rename, which would serialize the batch
+            # on disk flushes.
+            self._fsync_dir_fd(dir_fd)
+
+    @staticmethod
+    def _resolve_rename_conflicts(
+        rename_pairs: List[Tuple[str, str]],
+    ) -> Tuple[List[Tuple[str, str]], List[Tuple[str, str]]]:
+        """
+        Rewrites a rename batch so no destination clobbers a pending source.
+
+        Cyclic or chained renames (A -> B while B -> A or B -> C) could lose
+        data if executed independently - especially concurrently. Any pair
+        whose destination is still a pending source is routed through a
+        temporary name: moved aside in the first phase, then moved to its
+        final name in the second phase once every conflicting source has
+        vacated its spot.
+
+        Returns:
+            A (first_phase, second_phase) tuple of rename-pair lists; the
+            second phase must only run after the first has completed, and is
+            empty for conflict-free batches.
+        """
+        sources = {old for old, _ in rename_pairs}
+        first_phase: List[Tuple[str, str]] = []
+        second_phase: List[Tuple[str, str]] = []
+        for old, new in rename_pairs:
+            if new != old and new in sources:
+                temp = old + ".tmp-rename"
+                first_phase.append((old, temp))
+                second_phase.append((temp, new))
+            else:
+                first_phase.append((old, new))
+        return first_phase, second_phase
+
+    def _run_rename_phase(
+        self, rename_pairs: List[Tuple[str, str]], dir_fd: Optional[int]
+    ) -> None:
+        """Executes one conflict-free set of renames, in parallel when worthwhile."""
+        if not rename_pairs:
+            return
+        if len(rename_pairs) == 1:
+            self._perform_rename_operation(*rename_pairs[0], dir_fd=dir_fd)
+            return
+
+        # Renames release the GIL, so the pool scales past the CPU count;
+        # --jobs lets users tune (or serialize) this for their filesystem.
+        worker_limit = self.max_jobs or min(32, (os.cpu_count() or 1) * 4)
+        max_workers = max(1, min(worker_limit, len(rename_pairs)))
+        out_lines: List[str] = []
+        err_lines: List[str] = []
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(
+                lambda pair: self._rename_one(pair[0], pair[1], dir_fd=dir_fd),
+                rename_pairs,
+            )
+            for message, is_error in results:
+                (err_lines if is_error else out_lines).append(message)
+
+        # One buffered write per stream instead of a line-flushing print per
+        # rename; on big batches the per-print stdout lock/flush shows up.
+        if out_lines:
+            sys.stdout.write("\n".join(out_lines) + "\n")
+        if err_lines:
+            sys.stderr.write("\n".join(err_lines) + "\n")
+
+    @staticmethod
+    def _fsync_dir_fd(dir_fd: Optional[int]) -> None:
+        """Flushes directory metadata once after a rename batch completes."""
+        if dir_fd is None or os.name == "nt":
+            return
+        try:
+            os.fsync(dir_fd)
+        except OSError:
+            # Some filesystems refuse fsync on directory fds; renames are
+            # still applied, just without the explicit durability barrier.
+            pass
+
     def handle(self) -> None:
         """Main method to process files. Must be implemented by subclasses."""
         raise NotImplementedError("Subclasses must implement the 'handle' method.")
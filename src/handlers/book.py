@@ -1,8 +1,19 @@
-def handle_book(args):
-    """Handle book file processing."""
-    print("Processing book files ...")
-    if args.directory:
-        print(f"Directory: {args.directory}")
-    if args.file:
-        print(f"File: {args.file}")
-    print(f"Online mode: {args.online}")
\ No newline at end of file
+from .base_handler import BaseHandler
+
+
+class BookHandler(BaseHandler):
+    """
+    Handles the renaming of book files.
+
+    Currently a scaffold: it reports what it was asked to process until
+    book-specific renaming logic lands.
+    """
+
+    def handle(self) -> None:
+        """Main method to handle the book renaming process."""
+        print("Processing book files ...")
+        if self.args.directory:
+            print(f"Directory: {self.args.directory}")
+        if self.args.file:
+            print(f"File: {self.args.file}")
+        print(f"Online mode: {self.args.online}")
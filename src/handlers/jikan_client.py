@@ -18,24 +18,61 @@ except ImportError:
     APIException = None  # type: ignore
 
 
+# Maps every invalid filename character to an underscore in one C-level
+# pass; built once at import since sanitize_filename runs per title.
+_INVALID_CHARS_TABLE = str.maketrans({char: "_" for char in '<>:"/\\|?*'})
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
 def sanitize_filename(name: str) -> str:
     """Sanitizes a string to be used as a valid filename."""
-    name = re.sub(r'[<>:"/\\|?*]', "_", name)  # Replace invalid chars with underscore
-    name = re.sub(r"\s+", " ", name).strip()  # Normalize whitespace
+    name = name.translate(_INVALID_CHARS_TABLE)  # Replace invalid chars
+    name = _WHITESPACE_RE.sub(" ", name).strip()  # Normalize whitespace
     return name
 
 
+class _TokenBucket:
+    """
+    Paces API calls with burst capacity.
+
+    The first `burst` calls go through immediately - a single fetch should
+    not pay artificial latency - and sustained traffic is throttled to
+    `rate` calls per second by blocking until a token refills.
+    """
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.capacity = float(burst)
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+
+    def acquire(self) -> None:
+        """Blocks until a token is available, then consumes it."""
+        now = time.monotonic()
+        self.tokens = min(
+            self.capacity, self.tokens + (now - self.updated) * self.rate
+        )
+        self.updated = now
+        if self.tokens < 1.0:
+            time.sleep((1.0 - self.tokens) / self.rate)
+            self.updated = time.monotonic()
+            self.tokens = 1.0
+        self.tokens -= 1.0
+
+
 class JikanFetcher:
     """
     A client to fetch anime data from the Jikan API (MyAnimeList unofficial API).
     """
 
-    def __init__(self, ratelimit_sleep: float = 2.0):
+    def __init__(self, requests_per_second: float = 3.0, burst: int = 3):
         """
         Initializes the JikanFetcher.
 
         Args:
-            ratelimit_sleep: Seconds to sleep between Jikan API calls to respect rate limits.
+            requests_per_second: Sustained Jikan API call rate to respect
+                                 (the public API allows roughly 3 req/s).
+            burst: Number of initial calls allowed without throttling.
 
         Raises:
             ImportError: If Jikan library is not available.
@@ -45,7 +82,7 @@ class JikanFetcher:
                 "Jikan library could not be imported. Cannot create JikanFetcher."
             )
         self.jikan = Jikan()
-        self.ratelimit_sleep = ratelimit_sleep  # Jikan API has rate limits
+        self._bucket = _TokenBucket(rate=requests_per_second, burst=burst)
 
     def _make_api_call(self, api_call_func, *args, **kwargs):
         """
@@ -60,7 +97,7 @@ class JikanFetcher:
             The API response data, or None if an error occurs.
         """
         try:
-            time.sleep(self.ratelimit_sleep)  # Respect rate limits
+            self._bucket.acquire()  # Respect rate limits
             return api_call_func(*args, **kwargs)
         except APIException as e:  # type: ignore # APIException might be None if import failed
             print(f"Jikan API Error: {e}")
@@ -155,23 +192,29 @@ class JikanFetcher:
 
         try:
             os.makedirs(output_dir, exist_ok=True)
-            with open(csv_filepath, "w", newline="", encoding="utf-8") as csvfile:
+            # 64KB buffer: the whole episode list usually fits, so the CSV
+            # lands in one or two write syscalls instead of one per chunk.
+            with open(
+                csv_filepath, "w", newline="", encoding="utf-8", buffering=65536
+            ) as csvfile:
                 writer = csv.writer(csvfile)
                 writer.writerow(headers)
-                for episode in episodes:
-                    writer.writerow(
-                        [
-                            episode.get("mal_id"),
-                            episode.get("title"),
-                            episode.get("title_japanese"),
-                            episode.get("title_romanji"),
-                            (
-                                episode.get("aired", "").split("T")[0]
-                                if episode.get("aired")
-                                else None
-                            ),
-                        ]
+                # writerows keeps the row loop inside the csv module's C
+                # implementation instead of one Python call per episode.
+                writer.writerows(
+                    (
+                        episode.get("mal_id"),
+                        episode.get("title"),
+                        episode.get("title_japanese"),
+                        episode.get("title_romanji"),
+                        (
+                            episode.get("aired", "").split("T", 1)[0]
+                            if episode.get("aired")
+                            else None
+                        ),
                     )
+                    for episode in episodes
+                )
             print(f"Successfully saved Jikan episode data to '{csv_filepath}'")
             return csv_filepath
         except IOError as e:
@@ -1,8 +1,19 @@
-def handle_movie(args):
-    """Handle movie file processing."""
-    print("Processing movie files ...")
-    if args.directory:
-        print(f"Directory: {args.directory}")
-    if args.file:
-        print(f"File: {args.file}")
-    print(f"Online mode: {args.online}")
\ No newline at end of file
+from .base_handler import BaseHandler
+
+
+class MovieHandler(BaseHandler):
+    """
+    Handles the renaming of movie files.
+
+    Currently a scaffold: it reports what it was asked to process until
+    movie-specific renaming logic lands.
+    """
+
+    def handle(self) -> None:
+        """Main method to handle the movie renaming process."""
+        print("Processing movie files ...")
+        if self.args.directory:
+            print(f"Directory: {self.args.directory}")
+        if self.args.file:
+            print(f"File: {self.args.file}")
+        print(f"Online mode: {self.args.online}")
@@ -1,8 +1,19 @@
-def handle_std(args):
-    """Handle standard file processing."""
-    print("Processing standard files ...")
-    if args.directory:
-        print(f"Directory: {args.directory}")
-    if args.file:
-        print(f"File: {args.file}")
-    print(f"Creative mode: {args.creative}")
\ No newline at end of file
+from .base_handler import BaseHandler
+
+
+class StdHandler(BaseHandler):
+    """
+    Handles general-purpose file name standardization.
+
+    Currently a scaffold: it reports what it was asked to process until
+    the standardization logic lands.
+    """
+
+    def handle(self) -> None:
+        """Main method to handle the standardization process."""
+        print("Processing standard files ...")
+        if self.args.directory:
+            print(f"Directory: {self.args.directory}")
+        if self.args.file:
+            print(f"File: {self.args.file}")
+        print(f"Creative mode: {self.args.creative}")